@@ -10,16 +10,18 @@ import logging
 import os
 import re
 import shutil
-from wsgiref.util import FileWrapper
+from collections import namedtuple
 
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
 from django.core.files import File
 from django.core.files.storage import FileSystemStorage
 from django.db import transaction
-from django.http import Http404, HttpResponse, HttpResponseNotFound, StreamingHttpResponse
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotFound
 from django.shortcuts import redirect
+from django.utils.cache import get_conditional_response
 from django.utils.translation import gettext as _
 from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import ensure_csrf_cookie
@@ -36,6 +38,7 @@ from common.djangoapps.edxmako.shortcuts import render_to_response
 from common.djangoapps.student.auth import has_course_author_access
 from common.djangoapps.util.json_request import JsonResponse
 from common.djangoapps.util.monitoring import monitor_import_failure
+from common.djangoapps.util.query import use_read_replica_if_available
 from common.djangoapps.util.views import ensure_valid_course_key
 from xmodule.modulestore.django import modulestore  # lint-amnesty, pylint: disable=wrong-import-order
 
@@ -61,6 +64,16 @@ CONTENT_RE = re.compile(r"(?P<start>\d{1,11})-(?P<stop>\d{1,11})/(?P<end>\d{1,11
 
 STATUS_FILTERS = user_tasks_settings.USER_TASKS_STATUS_FILTERS
 
+TERMINAL_TASK_STATES = (UserTaskStatus.SUCCEEDED, UserTaskStatus.FAILED, UserTaskStatus.CANCELED)
+
+# How long (in seconds) to cache the latest export task status for a polling user.
+# Terminal states can't change until a new export is started, which clears the cache.
+EXPORT_STATUS_CACHE_TIMEOUT = 5
+EXPORT_STATUS_TERMINAL_CACHE_TIMEOUT = 60
+
+# The fields of an export's UserTaskStatus that its status poll reads; only these are cached
+ExportTaskStatus = namedtuple('ExportTaskStatus', ['pk', 'state', 'completed_steps', 'modified'])
+
 
 @transaction.non_atomic_requests
 @login_required
@@ -270,11 +283,7 @@ def import_status_handler(request, course_key_string, filename=None):
     task_status = task_status.order_by('-created').first()
     if task_status is None:
         # The task hasn't been initialized yet; did we store info in the session already?
-        try:
-            session_status = request.session["import_status"]
-            status = session_status[course_key_string + filename]
-        except KeyError:
-            status = 0
+        status = request.session.get("import_status", {}).get(course_key_string + filename, 0)
     elif task_status.state == UserTaskStatus.SUCCEEDED:
         status = 4
     elif task_status.state in (UserTaskStatus.FAILED, UserTaskStatus.CANCELED):
@@ -292,9 +301,15 @@ def send_tarball(tarball, size):
     """
     Renders a tarball to response, for use when sending a tar.gz file to the user.
     """
-    wrapper = FileWrapper(tarball, settings.COURSE_EXPORT_DOWNLOAD_CHUNK_SIZE)
-    response = StreamingHttpResponse(wrapper, content_type='application/x-tgz')
-    response['Content-Disposition'] = 'attachment; filename=%s' % os.path.basename(tarball.name)
+    response = FileResponse(
+        tarball,
+        as_attachment=True,
+        filename=os.path.basename(tarball.name),
+        content_type='application/x-tgz',
+    )
+    # FileResponse hands the file to the server's wsgi.file_wrapper (sendfile) when
+    # available; this chunk size only applies when it falls back to streaming.
+    response.block_size = settings.COURSE_EXPORT_DOWNLOAD_CHUNK_SIZE
     response['Content-Length'] = size
     return response
 
@@ -344,6 +359,12 @@ def export_handler(request, course_key_string):
 
     if request.method == 'POST':
         export_olx.delay(request.user.id, course_key_string, request.LANGUAGE_CODE)
+        # Replace any cached status of a previous export with the new task's status,
+        # read from the primary database so that polls made before the new status
+        # reaches the read replica don't report the previous export instead.
+        _cache_task_status(
+            request, course_key_string, _query_latest_task_status(request, course_key_string, export_handler)
+        )
         return JsonResponse({'ExportStatus': 1})
     elif 'text/html' in requested_format:
         if use_new_export_page(course_key) and not library:
@@ -358,6 +379,7 @@ def export_handler(request, course_key_string):
 @require_GET
 @ensure_csrf_cookie
 @login_required
+@cache_control(no_cache=True, must_revalidate=True)
 @ensure_valid_course_key
 def export_status_handler(request, course_key_string):
     """
@@ -371,6 +393,12 @@ def export_status_handler(request, course_key_string):
 
     If the export was successful, a URL for the generated .tar.gz file is also
     returned.
+
+    While the export is unfinished, the response also includes a "RetryAfter"
+    value (mirrored in the Retry-After header) with the number of seconds the
+    client should wait before polling again. Responses for an export that is
+    still running carry an ETag, and a poll with a matching If-None-Match header
+    gets an empty 304 response instead.
     """
     course_key = CourseKey.from_string(course_key_string)
     if not has_course_author_access(request.user, course_key):
@@ -378,18 +406,27 @@ def export_status_handler(request, course_key_string):
 
     # The task status record is authoritative once it's been created
     task_status = _latest_task_status(request, course_key_string, export_status_handler)
-    output_url = None
-    error = None
     if task_status is None:
         # The task hasn't been initialized yet; did we store info in the session already?
-        try:
-            session_status = request.session["export_status"]
-            status = session_status[course_key_string]
-        except KeyError:
-            status = 0
-    elif task_status.state == UserTaskStatus.SUCCEEDED:
+        status = request.session.get("export_status", {}).get(course_key_string, 0)
+        return _export_status_response({"ExportStatus": status})
+    if task_status.state not in TERMINAL_TASK_STATES:
+        # Still running; nothing else to report until it finishes. The status record
+        # is updated whenever the export progresses, so the client already has the
+        # right response if it has seen this version of the record. (Finished exports
+        # may include a download URL that expires, so those are always sent in full.)
+        etag = f'W/"{task_status.pk}-{task_status.modified.timestamp()}"'
+        conditional_response = get_conditional_response(request, etag=etag)
+        if conditional_response is not None:
+            conditional_response['ETag'] = etag
+            return conditional_response
+        return _export_status_response({"ExportStatus": min(task_status.completed_steps + 1, 2)}, etag)
+
+    output_url = None
+    error = None
+    if task_status.state == UserTaskStatus.SUCCEEDED:
         status = 3
-        artifact = UserTaskArtifact.objects.get(status=task_status, name='Output')
+        artifact = UserTaskArtifact.objects.get(status_id=task_status.pk, name='Output')
         if isinstance(artifact.file.storage, FileSystemStorage):
             output_url = reverse_course_url('export_output_handler', course_key)
         elif isinstance(artifact.file.storage, S3Boto3Storage):
@@ -402,25 +439,53 @@ def export_status_handler(request, course_key_string):
             })
         else:
             output_url = artifact.file.storage.url(artifact.file.name)
-    elif task_status.state in (UserTaskStatus.FAILED, UserTaskStatus.CANCELED):
+    else:
         status = max(-(task_status.completed_steps + 1), -2)
-        errors = UserTaskArtifact.objects.filter(status=task_status, name='Error')
-        if errors:
-            error = errors[0].text
+        error_artifact = UserTaskArtifact.objects.filter(status_id=task_status.pk, name='Error').only('text').first()
+        if error_artifact:
+            error = error_artifact.text
             try:
                 error = json.loads(error)
             except ValueError:
                 # Wasn't JSON, just use the value as a string
                 pass
-    else:
-        status = min(task_status.completed_steps + 1, 2)
 
     response = {"ExportStatus": status}
     if output_url:
         response['ExportOutput'] = output_url
     elif error:
         response['ExportError'] = error
-    return JsonResponse(response)
+    return _export_status_response(response)
+
+
+def _suggest_poll_interval(status):
+    """
+    Get the number of seconds a client should wait before polling again for an
+    export with the given status, or None if it has finished and there is
+    nothing left to poll for.
+    """
+    if status == 3 or status < 0:
+        return None
+    if status == 2:
+        # Compressing
+        return 5
+    return 2
+
+
+def _export_status_response(response, etag=None):
+    """
+    Build the JSON response for an export status poll, advising the client when
+    to poll next.
+    """
+    interval = _suggest_poll_interval(response['ExportStatus'])
+    if interval:
+        response['RetryAfter'] = interval
+    json_response = JsonResponse(response)
+    if interval:
+        json_response['Retry-After'] = interval
+    if etag:
+        json_response['ETag'] = etag
+    return json_response
 
 
 @transaction.non_atomic_requests
@@ -438,7 +503,7 @@ def export_output_handler(request, course_key_string):
     if not has_course_author_access(request.user, course_key):
         raise PermissionDenied()
 
-    task_status = _latest_task_status(request, course_key_string, export_output_handler)
+    task_status = _query_latest_task_status(request, course_key_string, export_output_handler)
     if task_status and task_status.state == UserTaskStatus.SUCCEEDED:
         artifact = None
         try:
@@ -454,14 +519,71 @@ def export_output_handler(request, course_key_string):
         raise Http404
 
 
+def _task_status_cache_key(request, course_key_string):
+    """
+    Get the cache key for the latest export status of the specified course/library
+    key, as seen by the requesting user.
+    """
+    return f'contentstore.export_status.{course_key_string}.{request.user.id}'
+
+
 def _latest_task_status(request, course_key_string, view_func=None):
     """
     Get the most recent export status update for the specified course/library
-    key.
+    key, as an ExportTaskStatus.
+
+    The result is cached briefly, since the Studio UI polls for it every few
+    seconds while an export is running. Cache misses are read from the read
+    replica if there is one; a running export's status that lags the primary
+    by a moment is harmless for a polling client. A finished status is always
+    confirmed against the primary, though: a lagging replica could still
+    return the previous export after a new one has started, and the client
+    would stop polling and report that old result.
+    """
+    cached_status = cache.get(_task_status_cache_key(request, course_key_string))
+    if cached_status is not None:
+        return ExportTaskStatus(**cached_status)
+    task_status = _query_latest_task_status(request, course_key_string, view_func, use_read_replica=True)
+    if task_status is not None and task_status.state in TERMINAL_TASK_STATES:
+        task_status = _query_latest_task_status(request, course_key_string, view_func)
+    return _cache_task_status(request, course_key_string, task_status)
+
+
+def _cache_task_status(request, course_key_string, task_status):
+    """
+    Cache the given export UserTaskStatus (if any) for status polls, replacing
+    whatever was cached before, and return it as an ExportTaskStatus.
+    """
+    cache_key = _task_status_cache_key(request, course_key_string)
+    if task_status is None:
+        cache.delete(cache_key)
+        return None
+    export_status = ExportTaskStatus(
+        pk=task_status.pk,
+        state=task_status.state,
+        completed_steps=task_status.completed_steps,
+        modified=task_status.modified,
+    )
+    if task_status.state in TERMINAL_TASK_STATES:
+        timeout = EXPORT_STATUS_TERMINAL_CACHE_TIMEOUT
+    else:
+        timeout = EXPORT_STATUS_CACHE_TIMEOUT
+    # Cache plain values rather than the model instance, so cached entries don't
+    # depend on the model's pickled form or on the database it was read from.
+    cache.set(cache_key, export_status._asdict(), timeout)
+    return export_status
+
+
+def _query_latest_task_status(request, course_key_string, view_func=None, use_read_replica=False):
+    """
+    Get the most recent export UserTaskStatus for the specified course/library
+    key from the database, bypassing the status poll cache.
     """
     args = {'course_key_string': course_key_string}
     name = CourseExportTask.generate_name(args)
-    task_status = UserTaskStatus.objects.filter(name=name)
+    task_status = UserTaskStatus.objects.filter(name=name).only('state', 'completed_steps', 'created', 'modified', 'id')
+    if use_read_replica:
+        task_status = use_read_replica_if_available(task_status)
     for status_filter in STATUS_FILTERS:
         task_status = status_filter().filter_queryset(request, task_status, view_func)
     return task_status.order_by('-created').first()
@@ -10,8 +10,9 @@ import re
 import shutil
 import tarfile
 import tempfile
+from datetime import datetime, timedelta, timezone
 from io import BytesIO
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from uuid import uuid4
 from zipfile import ZipFile
 
@@ -20,8 +21,10 @@ import lxml
 from bson import ObjectId
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import SuspiciousOperation
 from django.core.files.storage import FileSystemStorage
+from django.test.client import RequestFactory
 from django.test.utils import override_settings
 from milestones.tests.utils import MilestonesTestCaseMixin
 from opaque_keys.edx.locator import LibraryLocator
@@ -31,9 +34,17 @@ from user_tasks.models import UserTaskStatus
 
 from cms.djangoapps.contentstore import errors as import_error
 from cms.djangoapps.contentstore.storage import course_import_export_storage
+from cms.djangoapps.contentstore.tasks import CourseExportTask
 from cms.djangoapps.contentstore.tests.test_libraries import LibraryTestCase
 from cms.djangoapps.contentstore.tests.utils import CourseTestCase
 from cms.djangoapps.contentstore.utils import reverse_course_url
+from cms.djangoapps.contentstore.views.import_export import (
+    EXPORT_STATUS_CACHE_TIMEOUT,
+    EXPORT_STATUS_TERMINAL_CACHE_TIMEOUT,
+    _latest_task_status,
+    _query_latest_task_status,
+    export_handler,
+)
 from cms.djangoapps.models.settings.course_metadata import CourseMetadata
 from common.djangoapps.student import auth
 from common.djangoapps.student.roles import CourseInstructorRole, CourseStaffRole
@@ -992,6 +1003,19 @@ class ExportTestCase(CourseTestCase):
         mock_artifact.file.storage.url.return_value = file_url
         return mock_artifact
 
+    def _create_export_status(self, state):
+        """
+        Creates an export task status record for the test course.
+        """
+        return UserTaskStatus.objects.create(
+            user=self.user,
+            task_id=str(uuid4()),
+            task_class='cms.djangoapps.contentstore.tasks.export_olx',
+            name=CourseExportTask.generate_name({'course_key_string': str(self.course.id)}),
+            state=state,
+            total_steps=2,
+        )
+
     @patch('cms.djangoapps.contentstore.views.import_export._latest_task_status')
     @patch('user_tasks.models.UserTaskArtifact.objects.get')
     def test_export_status_handler_other(
@@ -1052,6 +1076,215 @@ class ExportTestCase(CourseTestCase):
         file_export_output_url = reverse_course_url('export_output_handler', self.course.id)
         self.assertEqual(result['ExportOutput'], file_export_output_url)
 
+    @patch('cms.djangoapps.contentstore.views.import_export.cache')
+    def test_export_status_cached(self, mock_cache):
+        """
+        Verify that a cached export task status is used instead of querying for it
+        """
+        mock_cache.get.return_value = {
+            'pk': 1,
+            'state': UserTaskStatus.IN_PROGRESS,
+            'completed_steps': 1,
+            'modified': datetime(2024, 1, 1, tzinfo=timezone.utc),
+        }
+        resp = self.client.get(self.status_url)
+        result = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(result['ExportStatus'], 2)
+        mock_cache.set.assert_not_called()
+
+    @ddt.data(
+        (UserTaskStatus.IN_PROGRESS, 0, 2),
+        (UserTaskStatus.IN_PROGRESS, 1, 5),
+        (UserTaskStatus.FAILED, 0, None),
+    )
+    @ddt.unpack
+    @patch('cms.djangoapps.contentstore.views.import_export._latest_task_status')
+    @patch('user_tasks.models.UserTaskArtifact.objects.filter')
+    def test_export_status_retry_after(
+        self,
+        state,
+        completed_steps,
+        expected_interval,
+        mock_filter_user_task_artifacts,
+        mock_latest_task_status,
+    ):
+        """
+        Verify that the export status handler advises the client when to poll next
+        """
+        mock_latest_task_status.return_value = Mock(state=state, completed_steps=completed_steps)
+        mock_filter_user_task_artifacts.return_value.only.return_value.first.return_value = None
+        resp = self.client.get(self.status_url)
+        result = json.loads(resp.content.decode('utf-8'))
+        if expected_interval is None:
+            # Nothing left to poll for once the export has finished
+            self.assertNotIn('RetryAfter', result)
+            self.assertFalse(resp.has_header('Retry-After'))
+        else:
+            self.assertEqual(result['RetryAfter'], expected_interval)
+            self.assertEqual(resp['Retry-After'], str(expected_interval))
+
+    @patch('cms.djangoapps.contentstore.views.import_export._latest_task_status')
+    def test_export_status_not_modified(self, mock_latest_task_status):
+        """
+        Verify that polling for an export status the client has already seen yields a 304
+        """
+        mock_latest_task_status.return_value = Mock(
+            state=UserTaskStatus.IN_PROGRESS,
+            completed_steps=0,
+            pk=1,
+            modified=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        resp = self.client.get(self.status_url)
+        self.assertEqual(resp.status_code, 200)
+        etag = resp['ETag']
+
+        resp = self.client.get(self.status_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp['ETag'], etag)
+
+        resp = self.client.get(self.status_url, HTTP_IF_NONE_MATCH=f'W/"0-0", {etag}')
+        self.assertEqual(resp.status_code, 304)
+
+        mock_latest_task_status.return_value.completed_steps = 1
+        mock_latest_task_status.return_value.modified = datetime(2024, 1, 1, 0, 1, tzinfo=timezone.utc)
+        resp = self.client.get(self.status_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(json.loads(resp.content.decode('utf-8'))['ExportStatus'], 2)
+
+    @patch('cms.djangoapps.contentstore.views.import_export._latest_task_status')
+    @patch('user_tasks.models.UserTaskArtifact.objects.get')
+    def test_export_status_succeeded_not_cached(self, mock_get_user_task_artifact, mock_latest_task_status):
+        """
+        Verify that a finished export's status is always sent in full, so that a
+        revalidating client gets a fresh (unexpired) download URL
+        """
+        modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        mock_latest_task_status.return_value = Mock(state=UserTaskStatus.SUCCEEDED, pk=1, modified=modified)
+        mock_get_user_task_artifact.return_value = self._mock_artifact(
+            spec=S3Boto3Storage,
+            file_url='/s3/file/path/testfile.tar.gz?Expires=2',
+        )
+        resp = self.client.get(self.status_url, HTTP_IF_NONE_MATCH=f'W/"1-{modified.timestamp()}"')
+        self.assertEqual(resp.status_code, 200)
+        self.assertFalse(resp.has_header('ETag'))
+        self.assertIn('no-cache', resp['Cache-Control'])
+        result = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(result['ExportOutput'], '/s3/file/path/testfile.tar.gz?Expires=2')
+
+    @ddt.data(
+        (UserTaskStatus.IN_PROGRESS, EXPORT_STATUS_CACHE_TIMEOUT),
+        (UserTaskStatus.SUCCEEDED, EXPORT_STATUS_TERMINAL_CACHE_TIMEOUT),
+        (UserTaskStatus.FAILED, EXPORT_STATUS_TERMINAL_CACHE_TIMEOUT),
+    )
+    @ddt.unpack
+    @patch('cms.djangoapps.contentstore.views.import_export.cache')
+    def test_latest_task_status_cache_timeout(self, state, expected_timeout, mock_cache):
+        """
+        Verify that a looked up export status is cached, for longer once the export has finished
+        """
+        mock_cache.get.return_value = None
+        task_status = self._create_export_status(state)
+        request = RequestFactory().get(self.status_url)
+        request.user = self.user
+
+        export_status = _latest_task_status(request, str(self.course.id))
+        self.assertEqual(export_status.pk, task_status.pk)
+        self.assertEqual(export_status.state, state)
+        # Only plain values are cached, not the model instance
+        mock_cache.set.assert_called_once_with(
+            f'contentstore.export_status.{self.course.id}.{self.user.id}',
+            {
+                'pk': task_status.pk,
+                'state': state,
+                'completed_steps': task_status.completed_steps,
+                'modified': task_status.modified,
+            },
+            expected_timeout,
+        )
+
+    def test_export_replaces_cached_status(self):
+        """
+        Verify that starting a new export replaces the cached status of the previous one
+        """
+        previous_status = self._create_export_status(UserTaskStatus.FAILED)
+        UserTaskStatus.objects.filter(pk=previous_status.pk).update(
+            created=datetime.now(timezone.utc) - timedelta(days=1)
+        )
+        resp = self.client.get(self.status_url)
+        self.assertEqual(json.loads(resp.content.decode('utf-8'))['ExportStatus'], -1)
+
+        # The export task runs eagerly in tests, so it has finished by the time the POST returns
+        resp = self.client.post(self.url)
+        self.assertEqual(resp.status_code, 200)
+        resp = self.client.get(self.status_url)
+        result = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(result['ExportStatus'], 3)
+        self.assertIn('ExportOutput', result)
+
+    @patch(
+        'cms.djangoapps.contentstore.views.import_export.use_read_replica_if_available',
+        side_effect=lambda queryset: queryset,
+    )
+    def test_export_status_uses_read_replica(self, mock_use_read_replica):
+        """
+        Verify that export status polls read from the read replica
+        """
+        self._create_export_status(UserTaskStatus.IN_PROGRESS)
+        resp = self.client.get(self.status_url)
+        self.assertEqual(json.loads(resp.content.decode('utf-8'))['ExportStatus'], 1)
+        mock_use_read_replica.assert_called_once()
+
+    @patch(
+        'cms.djangoapps.contentstore.views.import_export._query_latest_task_status',
+        wraps=_query_latest_task_status,
+    )
+    @patch(
+        'cms.djangoapps.contentstore.views.import_export.use_read_replica_if_available',
+        side_effect=lambda queryset: queryset,
+    )
+    def test_export_reads_new_status_from_primary(self, mock_use_read_replica, mock_query_latest_task_status):
+        """
+        Verify that starting an export caches the new task's status as read from the
+        primary database, so that a lagging read replica can't report the previous export
+        """
+        resp = self.client.post(self.url)
+        self.assertEqual(resp.status_code, 200)
+        mock_query_latest_task_status.assert_called_once_with(ANY, str(self.course.id), export_handler)
+        mock_use_read_replica.assert_not_called()
+
+        # The following poll is answered from the cache rather than the replica
+        resp = self.client.get(self.status_url)
+        self.assertEqual(json.loads(resp.content.decode('utf-8'))['ExportStatus'], 3)
+        mock_use_read_replica.assert_not_called()
+
+    def test_export_status_ignores_stale_replica(self):
+        """
+        Verify that a finished export read from a lagging read replica isn't reported
+        (or cached) once a newer export has been started
+        """
+        previous_status = self._create_export_status(UserTaskStatus.SUCCEEDED)
+        UserTaskStatus.objects.filter(pk=previous_status.pk).update(
+            created=datetime.now(timezone.utc) - timedelta(days=1)
+        )
+        stale_queryset = UserTaskStatus.objects.filter(pk=previous_status.pk)
+        with patch('cms.djangoapps.contentstore.views.import_export.export_olx') as mock_export_olx:
+            # Starting the task creates its status record, but doesn't run it
+            mock_export_olx.delay.side_effect = lambda *args: self._create_export_status(UserTaskStatus.PENDING)
+            resp = self.client.post(self.url)
+        self.assertEqual(resp.status_code, 200)
+
+        # The status primed by the POST has expired, and the replica hasn't caught up yet
+        cache.delete(f'contentstore.export_status.{self.course.id}.{self.user.id}')
+        with patch(
+            'cms.djangoapps.contentstore.views.import_export.use_read_replica_if_available',
+            return_value=stale_queryset,
+        ):
+            resp = self.client.get(self.status_url)
+            self.assertEqual(json.loads(resp.content.decode('utf-8'))['ExportStatus'], 1)
+            # The stale status wasn't cached either
+            resp = self.client.get(self.status_url)
+            self.assertEqual(json.loads(resp.content.decode('utf-8'))['ExportStatus'], 1)
+
 
 @override_settings(CONTENTSTORE=TEST_DATA_CONTENTSTORE)
 class TestLibraryImportExport(CourseTestCase):
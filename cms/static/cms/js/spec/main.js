@@ -237,6 +237,7 @@
         'js/spec/models/textbook_spec',
         'js/spec/models/upload_spec',
         'js/spec/views/course_info_spec',
+        'js/spec/views/export_spec',
         'js/spec/views/metadata_edit_spec',
         'js/spec/views/textbook_spec',
         'js/spec/views/upload_spec',
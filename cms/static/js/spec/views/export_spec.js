@@ -0,0 +1,61 @@
+define(['jquery', 'edx-ui-toolkit/js/utils/spec-helpers/ajax-helpers', 'js/views/export'],
+    function($, AjaxHelpers, Export) {
+        'use strict';
+
+        describe('Course export status polling', function() {
+            var statusUrl = '/export_status/course-v1:edX+DemoX+Demo_Course';
+
+            beforeEach(function() {
+                jasmine.clock().install();
+                Export.reset(false);
+            });
+
+            afterEach(function() {
+                Export.reset(false);
+                jasmine.clock().uninstall();
+                $.removeCookie('lastexport', {path: window.location.pathname});
+            });
+
+            it('shows a successful export right away', function() {
+                var requests = AjaxHelpers.requests(this),
+                    completed = jasmine.createSpy('completed');
+                Export.start(statusUrl).then(completed);
+
+                Export.pollStatus({ExportStatus: 3, ExportOutput: '/export_output/course'});
+
+                expect(completed).toHaveBeenCalled();
+                jasmine.clock().tick(60000);
+                AjaxHelpers.expectNoRequests(requests);
+            });
+
+            it('shows a failed export right away', function() {
+                var requests = AjaxHelpers.requests(this),
+                    completed = jasmine.createSpy('completed');
+                spyOn(Export, 'showError');
+                Export.start(statusUrl).then(completed);
+
+                Export.pollStatus({ExportStatus: -2, ExportError: 'Something went wrong'});
+
+                expect(completed).toHaveBeenCalled();
+                expect(Export.showError).toHaveBeenCalledWith(null, 'Something went wrong');
+                jasmine.clock().tick(60000);
+                AjaxHelpers.expectNoRequests(requests);
+            });
+
+            it('waits for the suggested interval before polling again', function() {
+                var requests = AjaxHelpers.requests(this),
+                    completed = jasmine.createSpy('completed');
+                Export.start(statusUrl).then(completed);
+
+                Export.pollStatus({ExportStatus: 1, RetryAfter: 2});
+
+                jasmine.clock().tick(1999);
+                AjaxHelpers.expectNoRequests(requests);
+                jasmine.clock().tick(1);
+                AjaxHelpers.expectRequest(requests, 'GET', statusUrl);
+
+                AjaxHelpers.respondWithJson(requests, {ExportStatus: 3, ExportOutput: '/export_output/course'});
+                expect(completed).toHaveBeenCalled();
+            });
+        });
+    });
@@ -222,8 +222,9 @@ define([
         /**
          * Entry point for server feedback
          *
-         * Checks for export status updates every `timeout` milliseconds,
-         * and updates the page accordingly.
+         * Updates the page with the given status and, while the export is
+         * in progress, checks for the next update after `timeout` milliseconds
+         * (or after the status's `RetryAfter` seconds, if given).
          *
          * @param {int} [stage=0] Starting stage.
          */
@@ -252,11 +253,12 @@ define([
             } else { // In progress
                 updateFeedbackList();
 
-                $.getJSON(statusUrl, function(result) {
-                    timeout.id = setTimeout(function() {
+                // Honor the server's advice on when to poll next, if any
+                timeout.id = setTimeout(function() {
+                    $.getJSON(statusUrl, function(result) {
                         this.pollStatus(result);
-                    }.bind(this), timeout.delay);
-                }.bind(this));
+                    }.bind(this));
+                }.bind(this), data.RetryAfter ? data.RetryAfter * 1000 : timeout.delay);
             }
         },
 
@@ -1,6 +1,8 @@
 """Test for Word Cloud Block functional logic."""
 
+import copy
 import json
+from types import MappingProxyType
 from unittest.mock import Mock
 
 from django.test import TestCase
@@ -14,18 +16,33 @@ from xmodule.word_cloud_block import WordCloudBlock
 from . import get_test_descriptor_system, get_test_system
 
 
+ORIGINAL_XML = (
+    '<word_cloud display_name="Favorite Fruits" display_student_percents="false" '
+    'instructions="What are your favorite fruits?" num_inputs="3" num_top_words="100"/>\n'
+)
+
+
 class WordCloudBlockTest(TestCase):
     """
     Logic tests for Word Cloud Block.
     """
 
-    raw_field_data = {
+    # Read-only, so that a block saving its fields can't leak state into other tests;
+    # use _field_data() to get a fresh, writable (deep) copy, since blocks update
+    # dict fields such as all_words in place.
+    raw_field_data = MappingProxyType({
         'all_words': {'cat': 10, 'dog': 5, 'mom': 1, 'dad': 2},
         'top_words': {'cat': 10, 'dog': 5, 'dad': 2},
         'submitted': False,
         'display_name': 'Word Cloud Block',
         'instructions': 'Enter some random words that comes to your mind'
-    }
+    })
+
+    def _field_data(self):
+        """
+        Get field data for a new block, initialized from ``raw_field_data``.
+        """
+        return DictFieldData(copy.deepcopy(dict(self.raw_field_data)))
 
     def test_xml_import_export_cycle(self):
         """
@@ -35,12 +52,7 @@ class WordCloudBlockTest(TestCase):
         runtime = get_test_descriptor_system()
         runtime.export_fs = MemoryFS()
 
-        original_xml = (
-            '<word_cloud display_name="Favorite Fruits" display_student_percents="false" '
-            'instructions="What are your favorite fruits?" num_inputs="3" num_top_words="100"/>\n'
-        )
-
-        olx_element = etree.fromstring(original_xml)
+        olx_element = etree.fromstring(ORIGINAL_XML)
         runtime.id_generator = Mock()
         block = WordCloudBlock.parse_xml(olx_element, runtime, None)
         block.location = BlockUsageLocator(
@@ -59,7 +71,7 @@ class WordCloudBlockTest(TestCase):
         with runtime.export_fs.open('word_cloud/block_id.xml') as f:
             exported_xml = f.read()
 
-        assert exported_xml == original_xml
+        assert exported_xml == ORIGINAL_XML
 
     def test_bad_ajax_request(self):
         """
@@ -67,7 +79,7 @@ class WordCloudBlockTest(TestCase):
         """
 
         module_system = get_test_system()
-        block = WordCloudBlock(module_system, DictFieldData(self.raw_field_data), Mock())
+        block = WordCloudBlock(module_system, self._field_data(), Mock())
 
         response = json.loads(block.handle_ajax('bad_dispatch', {}))
         self.assertDictEqual(response, {
@@ -81,7 +93,7 @@ class WordCloudBlockTest(TestCase):
         """
 
         module_system = get_test_system()
-        block = WordCloudBlock(module_system, DictFieldData(self.raw_field_data), Mock())
+        block = WordCloudBlock(module_system, self._field_data(), Mock())
 
         post_data = MultiDict(('student_words[]', word) for word in ['cat', 'cat', 'dog', 'sun'])
         response = json.loads(block.handle_ajax('submit', post_data))
@@ -104,13 +116,16 @@ class WordCloudBlockTest(TestCase):
 
         assert 100.0 == sum(i['percent'] for i in response['top_words'])
 
+        # The shared fixture is untouched, so other tests (or reruns) start from the same words
+        assert self.raw_field_data['all_words'] == {'cat': 10, 'dog': 5, 'mom': 1, 'dad': 2}
+
     def test_indexibility(self):
         """
         Test indexibility of Word Cloud
         """
 
         module_system = get_test_system()
-        block = WordCloudBlock(module_system, DictFieldData(self.raw_field_data), Mock())
+        block = WordCloudBlock(module_system, self._field_data(), Mock())
         assert block.index_dictionary() ==\
                {'content_type': 'Word Cloud',
                 'content': {'display_name': 'Word Cloud Block',